@@ -5,24 +5,16 @@ Connects to SIM800C via serial port and performs initial setup and verification.
 """
 
 import serial
-import time
 import os
 import sys
 
 # Handle imports when running as script or module
 try:
-    from sim800c import SIM800C as BaseSIM800C
+    from sim800c import SIM800C as BaseSIM800C, StatusKind, load_env
 except ImportError:
     import os
     sys.path.insert(0, os.path.dirname(__file__))
-    from sim800c import SIM800C as BaseSIM800C
-
-# Try to load environment variables from .env file if python-dotenv is available
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass  # python-dotenv is not installed, skip .env loading
+    from sim800c import SIM800C as BaseSIM800C, StatusKind, load_env
 
 
 class SIM800CInitializer(BaseSIM800C):
@@ -39,7 +31,8 @@ class SIM800CInitializer(BaseSIM800C):
             set_cmd='AT+CFUN=1',
             status_name='Power',
             success_msg='✓ Device is powered on (CFUN=1)',
-            enable_msg='Device is powered off, enabling power...'
+            enable_msg='Device is powered off, enabling power...',
+            kind=StatusKind.POWER
         )
     
     def check_and_set_pin(self):
@@ -61,7 +54,8 @@ class SIM800CInitializer(BaseSIM800C):
             set_cmd_func=get_pin_cmd,
             status_name='PIN',
             success_msg='✓ PIN is ready - no PIN required',
-            enable_msg='PIN required'
+            enable_msg='PIN required',
+            kind=StatusKind.PIN
         )
     
     def check_and_set_sms_mode(self):
@@ -87,9 +81,8 @@ class SIM800CInitializer(BaseSIM800C):
             return False
         
         try:
-            # Wait a bit for module to be ready
-            time.sleep(1)
-            
+            # No settle delay needed: opening no longer toggles DTR/RTS,
+            # so the module is not reset by the connect
             # Step 0: Try to disable echo and detect baudrate if needed
             print("\n=== Disabling Echo ===")
             echo_result = self.send_at_command('ATE0')
@@ -137,6 +130,8 @@ class SIM800CInitializer(BaseSIM800C):
 
 def main():
     """Main entry point."""
+    load_env()
+
     # Check for serial port argument
     port = sys.argv[1] if len(sys.argv) > 1 else '/dev/ttyS0'
     
@@ -4,16 +4,53 @@ SIM800C SMS Reader Script
 Connects to SIM800C and lists all SMS messages using AT+CMGL="ALL" command.
 """
 
+import re
 import sys
 import time
+from dataclasses import dataclass
+from functools import lru_cache
 
 # Handle imports when running as script or module
 try:
-    from sim800c import SIM800C
+    from sim800c import SIM800C, load_env
 except ImportError:
     import os
     sys.path.insert(0, os.path.dirname(__file__))
-    from sim800c import SIM800C
+    from sim800c import SIM800C, load_env
+
+# Header prefix, kept as a module constant for the cheap pre-filter. The
+# parser works on raw bytes so CMGL dumps are never decoded wholesale
+_CMGL_PREFIX = b'+CMGL:'
+
+# Matches UCS2 hex-encoded content: groups of four hex digits (one UTF-16BE
+# code unit each), so the charset and length checks happen in one C-level
+# scan and odd-length near-misses never reach the decoder
+_HEX_RE = re.compile(r'(?:[0-9A-Fa-f]{4})+')
+
+
+@lru_cache(maxsize=256)
+def _decode_ucs2(hexstr):
+    """Decode a hex-encoded UCS2/UTF-16BE SMS payload, caching repeats."""
+    return bytes.fromhex(hexstr).decode('utf-16-be')
+
+
+@dataclass(slots=True, frozen=True)
+class SMSRecord:
+    """
+    One parsed SMS message.
+
+    Slot-backed, so a SIM box holding hundreds of stored messages carries
+    five strings per record instead of a dict per message. Subscript
+    access is kept so existing record['index'] callers work unchanged.
+    """
+    index: str
+    status: str
+    sender: str
+    timestamp: str
+    content: str
+
+    def __getitem__(self, key):
+        return getattr(self, key)
 
 
 class SMSReader(SIM800C):
@@ -24,23 +61,24 @@ class SMSReader(SIM800C):
         List all SMS messages using AT+CMGL="ALL" command.
         
         Returns:
-            list of dictionaries with SMS data or None on failure
+            list of SMSRecord instances or None on failure
         """
         print("\n=== Reading SMS Messages ===")
-        
-        # Make sure we're in text mode
-        cmgf_result = self.send_at_command('AT+CMGF=1')
+
+        # One coalesced write covers the text-mode set and the list query;
+        # the pipeline splits the two responses back apart, so the listing
+        # costs a single round-trip instead of two
+        cmgf_result, result = self.send_at_pipeline(
+            ['AT+CMGF=1', 'AT+CMGL="ALL"'], timeout=5)
+
         if not cmgf_result['success']:
             print("✗ Failed to set SMS text mode")
             return None
-        
-        # Read all SMS messages
-        result = self.send_at_command('AT+CMGL="ALL"', timeout=5)
-        
+
         if not result['success']:
             print("✗ Failed to read SMS messages")
             return None
-        
+
         if not result['data']:
             print("✓ No SMS messages found")
             return []
@@ -51,111 +89,112 @@ class SMSReader(SIM800C):
         print(f"✓ Found {len(messages)} SMS message(s)")
         return messages
     
-    def parse_sms_messages(self, data):
+    def _iter_sms_messages(self, data):
         """
-        Parse SMS message data from AT+CMGL response.
-        
+        Yield parsed SMS messages one at a time from AT+CMGL response data.
+
         Format: +CMGL: index,status,number,timestamp,data
         Example: +CMGL: 0,"REC UNREAD","+1234567890","23/06/15,10:20:30+00"
-        
+
+        Args:
+            data: Response payload bytes
+
+        Yields:
+            SMSRecord instances with parsed SMS data
+        """
+        # Cheap substring test before doing any work at all
+        if _CMGL_PREFIX not in data:
+            return
+
+        # Header fields are extracted with plain bytes splits - no pattern
+        # engine at all. maxsplit=3 keeps the quoted timestamp whole even
+        # though it contains a comma
+        header = None
+        body = []
+        for line in data.split(b'\n'):
+            # bytes.startswith is a C-level compare, so the (more numerous)
+            # body lines cost almost nothing to classify
+            if line.startswith(_CMGL_PREFIX):
+                if header:
+                    yield self._emit_sms(header, body)
+                fields = line[len(_CMGL_PREFIX):].split(b',', 3)
+                if len(fields) == 4:
+                    index, status, sender, timestamp = fields
+                    header = (index.strip(),
+                              status.strip().strip(b'"'),
+                              sender.strip().strip(b'"'),
+                              timestamp.strip().strip(b'"'))
+                else:
+                    header = None  # malformed header, skip its block
+                body = []
+            else:
+                body.append(line)
+        if header:
+            yield self._emit_sms(header, body)
+
+    def _emit_sms(self, header, body_lines):
+        """Decode, print and package one parsed SMS message."""
+        # Only the extracted fields are decoded, never the whole payload
+        index, status, sender, timestamp = (
+            f.decode('utf-8', errors='replace') for f in header)
+        message_content = b'\n'.join(body_lines).decode(
+            'utf-8', errors='replace').strip()
+
+        # Try to decode message content if it appears to be hex-encoded Unicode
+        try:
+            # Check if content looks like hex-encoded (whole UTF-16 code units)
+            if _HEX_RE.fullmatch(message_content):
+                # Try to decode as UCS2/UTF-16BE (common for GSM Unicode SMS)
+                content_str = _decode_ucs2(message_content)
+            else:
+                content_str = message_content
+        except (ValueError, UnicodeDecodeError):
+            # If decoding fails, display as-is
+            content_str = message_content
+
+        # One buffered write per message instead of five print calls
+        sys.stdout.write(
+            f"\nMessage {index}:\n"
+            f"  Status: {status}\n"
+            f"  From: {sender}\n"
+            f"  Time: {timestamp}\n"
+            f"  Content: {content_str}\n"
+        )
+
+        return SMSRecord(
+            index=index,
+            status=status,
+            sender=sender,
+            timestamp=timestamp,
+            content=message_content
+        )
+
+    def parse_sms_messages_bytes(self, data):
+        """
+        Parse SMS message data from a raw AT+CMGL response payload.
+
+        Pairs with send_at_command_raw so large dumps go from the serial
+        buffer to parsed records without a wholesale str round-trip.
+
+        Args:
+            data: Response payload bytes
+
+        Returns:
+            list of SMSRecord instances with parsed SMS data
+        """
+        return list(self._iter_sms_messages(data))
+
+    def parse_sms_messages(self, data):
+        """
+        Parse SMS message data from AT+CMGL response.
+
         Args:
             data: Response data string
-            
+
         Returns:
-            list of dictionaries with parsed SMS data
+            list of SMSRecord instances with parsed SMS data
         """
-        messages = []
-        lines = data.split('\n')
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            if line.startswith('+CMGL:'):
-                try:
-                    # Parse the header line
-                    # Format: +CMGL: index,status,"sender","timestamp"
-                    # Note: timestamp may contain commas, so we need special handling
-                    
-                    # Remove the +CMGL: prefix to get the actual data
-                    header = line[len('+CMGL:'):].strip()
-                    
-                    # Parse with respect to quoted strings
-                    parts = []
-                    current_part = ''
-                    in_quotes = False
-                    
-                    for char in header:
-                        if char == '"':
-                            in_quotes = not in_quotes
-                            current_part += char
-                        elif char == ',' and not in_quotes:
-                            if current_part:
-                                parts.append(current_part.strip())
-                            current_part = ''
-                        else:
-                            current_part += char
-                    
-                    # Don't forget the last part
-                    if current_part:
-                        parts.append(current_part.strip())
-                    
-                    if len(parts) >= 4:
-                        index = parts[0].strip()
-                        
-                        # Parse status - handle quoted and unquoted
-                        status_raw = parts[1].strip()
-                        status = status_raw.strip('"')
-                        
-                        # Parse sender number - remove quotes
-                        sender_raw = parts[2].strip()
-                        sender = sender_raw.strip('"')
-                        
-                        # Parse timestamp - remove quotes
-                        timestamp_raw = parts[3].strip()
-                        timestamp = timestamp_raw.strip('"')
-                        
-                        # Get the actual message content (next line)
-                        message_content = ''
-                        if i + 1 < len(lines):
-                            message_content = lines[i + 1].strip()
-                        
-                        messages.append({
-                            'index': index,
-                            'status': status,
-                            'sender': sender,
-                            'timestamp': timestamp,
-                            'content': message_content
-                        })
-                        
-                        print(f"\nMessage {index}:")
-                        print(f"  Status: {status}")
-                        print(f"  From: {sender}")
-                        print(f"  Time: {timestamp}")
-                        # Try to decode message content if it appears to be hex-encoded Unicode
-                        try:
-                            # Check if content looks like hex-encoded (even length, all hex chars)
-                            if message_content and len(message_content) % 2 == 0 and all(c in '0123456789ABCDEFabcdef' for c in message_content):
-                                # Try to decode as UCS2/UTF-16BE (common for GSM Unicode SMS)
-                                decoded_content = bytes.fromhex(message_content).decode('utf-16-be')
-                                print(f"  Content: {decoded_content}")
-                            else:
-                                print(f"  Content: {message_content}")
-                        except (ValueError, UnicodeDecodeError):
-                            # If decoding fails, print as-is
-                            print(f"  Content: {message_content}")
-                    
-                        i += 2  # Skip the message content line
-                    else:
-                        i += 1
-                except Exception as e:
-                    print(f"Error parsing SMS line: {line}")
-                    print(f"Error: {e}")
-                    i += 1
-            else:
-                i += 1
-        
-        return messages
+        return self.parse_sms_messages_bytes(data.encode('utf-8', errors='replace'))
     
     def delete_sms(self, index):
         """
@@ -207,6 +246,8 @@ class SMSReader(SIM800C):
 
 def main():
     """Main entry point."""
+    load_env()
+
     # Check for serial port argument
     # Get port from environment variable or default
     port = SIM800C.read_env_variable('SIM800_PORT', '/dev/ttyS0')
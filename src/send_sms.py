@@ -4,21 +4,36 @@ SIM800C SMS Sender Script
 Connects to SIM800C and sends SMS messages to specified phone number.
 """
 
+import re
 import sys
 import time
 
 # Handle imports when running as script or module
 try:
-    from sim800c import SIM800C
+    from sim800c import SIM800C, load_env
 except ImportError:
     import os
     sys.path.insert(0, os.path.dirname(__file__))
-    from sim800c import SIM800C
+    from sim800c import SIM800C, load_env
+
+# Final-response markers for AT+CMGS, matched against the raw serial bytes
+# so each received line is scanned once instead of three substring tests
+_FINAL_RE = re.compile(rb'OK|ERROR|\+CMGS:')
+_SUCCESS_RE = re.compile(rb'OK|\+CMGS:')
+
+# Wire literals, encoded once at import
+_CRLF = b'\r\n'
+_CTRL_Z = b'\x1a'  # terminates and sends the SMS body
 
 
 class SMSSender(SIM800C):
     """Extended SIM800C driver for sending SMS messages."""
-    
+
+    def __init__(self, port='/dev/ttyS0', baudrate=115200, timeout=1):
+        """Initialize SMS sender."""
+        super().__init__(port, baudrate, timeout)
+        self._sms_text_mode = False
+
     def send_sms_message(self, phone_number, message):
         """
         Send an SMS message to a phone number.
@@ -32,11 +47,13 @@ class SMSSender(SIM800C):
         """
         print(f"\n=== Sending SMS to {phone_number} ===")
         
-        # Make sure we're in text mode
-        cmgf_result = self.send_at_command('AT+CMGF=1')
-        if not cmgf_result['success']:
-            print("✗ Failed to set SMS text mode")
-            return {'success': False, 'data': ''}
+        # Make sure we're in text mode; skip the round-trip once set
+        if not self._sms_text_mode:
+            cmgf_result = self.send_at_command('AT+CMGF=1')
+            if not cmgf_result['success']:
+                print("✗ Failed to set SMS text mode")
+                return {'success': False, 'data': ''}
+            self._sms_text_mode = True
         
         # Send AT+CMGS command
         cmgs_command = f'AT+CMGS="{phone_number}"'
@@ -46,60 +63,66 @@ class SMSSender(SIM800C):
         self.ser.reset_input_buffer()
         
         # Send the command
-        cmd = f"{cmgs_command}\r\n"
-        self.ser.write(cmd.encode())
-        
+        self.ser.write(cmgs_command.encode() + _CRLF)
+
         # Wait for the "> " prompt from the module
-        response_lines = []
-        prompt_received = False
-        start_time = time.time()
-        timeout = 5  # 5 seconds timeout
-        
-        while (time.time() - start_time) < timeout:
-            if self.ser.in_waiting:
-                line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                response_lines.append(line)
-                print(f"Received: {line}")
-                
-                if '>' in line:
-                    prompt_received = True
-                    break
-        
+        # A blocking read_until returns as soon as the prompt byte arrives,
+        # instead of polling in_waiting and sleeping between polls
+        old_timeout = self.ser.timeout
+        self.ser.timeout = 5  # 5 seconds timeout
+        # size bounds the read so a chatty modem cannot stall us past the
+        # prompt; the expected frame is just CRLF plus '> '
+        prompt = self.ser.read_until(b'>', size=64)
+        prompt_received = b'>' in prompt
+
         if not prompt_received:
+            self.ser.timeout = old_timeout
             print("✗ Did not receive '>' prompt from module")
             return {'success': False, 'data': ''}
-        
+
         # Now send the message content followed by Ctrl+Z (0x1A)
+        # One write call so the body and terminator go out in a single frame
         print(f"Sending message: {message}")
-        self.ser.write(message.encode())
-        self.ser.write(b'\x1A')  # Ctrl+Z to terminate and send
-        
-        # Wait for the response
-        response_lines = []
-        final_response_seen = False
-        start_time = time.time()
-        timeout = 10  # 10 seconds for sending
-        
-        while (time.time() - start_time) < timeout:
-            if self.ser.in_waiting:
-                line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                if line:
-                    response_lines.append(line)
-                    print(f"Received: {line}")
-                    
-                    if 'OK' in line or 'ERROR' in line or '+CMGS:' in line:
-                        final_response_seen = True
-                        if 'OK' in line or '+CMGS:' in line:
-                            # Give it a moment to potentially get more data
-                            time.sleep(0.2)
-                        break
-            
-            # Small sleep to avoid tight loop
-            time.sleep(0.01)
-        
-        response_data = '\n'.join(response_lines)
-        
-        if 'OK' in response_data or '+CMGS:' in response_data:
+        payload = message.encode('utf-8') + _CTRL_Z
+        self.ser.write(payload)
+        self.ser.flush()
+
+        # Wait for the response line by line, with a 10 second budget
+        # Accumulate raw bytes in one growing buffer and decode once at the
+        # end instead of allocating a str per line plus a final join
+        buf = bytearray()
+        sent_ok = False
+        # The +CMGS: final is network-bound - the modem routinely takes
+        # seconds to hand the SMS to the SMSC - so keep the 10s allowance
+        # and only stretch it for the wire-transfer time at very low bauds
+        # (1 start + 8 data + 1 stop bits per byte)
+        byte_time = 10.0 / self.baudrate
+        deadline = time.time() + max(10.0, 200 * byte_time)
+
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            self.ser.timeout = remaining
+            raw = self.ser.read_until(b'\n')
+            if not raw:
+                break  # read timed out with no data
+            buf += raw
+
+            if _FINAL_RE.search(raw):
+                if _SUCCESS_RE.search(raw):
+                    sent_ok = True
+                    # Give it a moment to potentially get more data
+                    time.sleep(0.2)
+                break
+
+        self.ser.timeout = old_timeout
+        response_data = bytes(buf).decode('utf-8', errors='ignore').strip()
+        for line in response_data.splitlines():
+            if line:
+                print(f"Received: {line}")
+
+        if sent_ok:
             print(f"✓ SMS sent successfully")
             return {'success': True, 'data': response_data}
         else:
@@ -122,18 +145,21 @@ class SMSSender(SIM800C):
             
             # Send each message
             success_count = 0
+            backoff = 1
             for i, message in enumerate(messages, 1):
                 print(f"\n--- Sending Message {i} of {len(messages)} ---")
                 result = self.send_sms_message(phone_number, message)
-                
+
                 if result['success']:
                     success_count += 1
+                    backoff = 1
                 else:
                     print(f"✗ Failed to send message {i}")
-                
-                # Small delay between messages to avoid overwhelming the module
-                if i < len(messages):
-                    time.sleep(1)
+                    # A healthy modem accepts the next CMGS immediately, so
+                    # only back off after a failure, doubling up to 8s
+                    if i < len(messages):
+                        time.sleep(backoff)
+                        backoff = min(backoff * 2, 8)
             
             self.h1_message(f"✓ SMS Sending Complete! Sent {success_count} of {len(messages)} message(s)")
             
@@ -146,14 +172,17 @@ class SMSSender(SIM800C):
 
 def main():
     """Main entry point."""
-    # Try to load environment variables from .env file
-    
+    # Load environment variables from .env file (no-op on repeat calls)
+    load_env()
+
+    # Validate required environment once up front; later reads hit the
+    # cached snapshot and cannot fail mid-run
     try:
-        from dotenv import load_dotenv
-        load_dotenv()
-    except ImportError:
-        pass
-    
+        SIM800C.validate_env(['SMS_PHONE_NUMBER', 'SMS_PHONE_NUMBER_LOG'])
+    except EnvironmentError as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
     # Get phone number from environment
     phone_number = SIM800C.read_env_variable('SMS_PHONE_NUMBER')
     phone_number_log = SIM800C.read_env_variable('SMS_PHONE_NUMBER_LOG')
@@ -167,9 +196,14 @@ def main():
             print(f"✗ Error: Invalid message number '{sys.argv[1]}'. Using default (1)")
             message_number = 1
     
-    # Get the specified message from environment
+    # Get the specified message from environment, falling back to the
+    # single MESSAGE variable for backward compatibility
     message_key = f'MESSAGE_{message_number}'
-    message = SIM800C.read_env_variable(message_key)
+    message = (SIM800C.read_env_variable(message_key, default='')
+               or SIM800C.read_env_variable('MESSAGE', default=''))
+    if not message:
+        print(f"✗ Error: neither {message_key} nor MESSAGE environment variable is set")
+        sys.exit(1)
     
     messages = [message]
     
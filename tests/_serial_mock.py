@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Shared serial-port mock helper for the driver test suites.
+"""
+
+from unittest.mock import Mock
+
+
+def make_serial_mock(frames=()):
+    """
+    Build a Mock serial port that replays pre-built response frames.
+
+    Each read_until (or read) call pops the next frame from a precomputed
+    queue; once it runs dry further reads return b'', which driver code
+    treats as a timed-out read. in_waiting is pinned to 0 so code taking
+    the read(in_waiting or 1) path blocks instead of spinning.
+
+    Args:
+        frames: iterable of bytes frames to replay, in order
+
+    Returns:
+        Mock configured as an open serial port
+    """
+    ser = Mock()
+    ser.is_open = True
+    ser.in_waiting = 0
+    ser.reset_input_buffer = Mock()
+    queue = iter(list(frames))
+    ser.read_until.side_effect = lambda *args, **kwargs: next(queue, b'')
+    ser.read.side_effect = lambda size=1: next(queue, b'')
+    return ser
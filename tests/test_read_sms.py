@@ -7,7 +7,6 @@ import pytest
 import serial
 import time
 from unittest.mock import Mock, patch
-from io import BytesIO
 
 import sys
 import os
@@ -30,32 +29,33 @@ class TestSMSReader:
     
     def test_list_all_sms_no_messages(self):
         """Test listing SMS when no messages exist."""
-        with patch.object(self.reader, 'send_at_command') as mock_send:
-            mock_send.side_effect = [
+        with patch.object(self.reader, 'send_at_pipeline') as mock_send:
+            mock_send.return_value = [
                 {'success': True, 'data': ''},  # CMGF=1
                 {'success': True, 'data': ''}   # CMGL="ALL" - empty
             ]
-            
+
             messages = self.reader.list_all_sms()
-            
+
             assert messages == []
-            assert mock_send.call_count == 2
-    
+            mock_send.assert_called_once_with(
+                ['AT+CMGF=1', 'AT+CMGL="ALL"'], timeout=5)
+
     def test_list_all_sms_with_messages(self):
         """Test listing SMS with messages."""
         mock_sms_data = '''+CMGL: 0,"REC UNREAD","+1234567890","23/10/15,10:20:30+00"
 Hello World
 +CMGL: 1,"REC READ","+9876543210","23/10/15,11:30:45+00"
 Test message'''
-        
-        with patch.object(self.reader, 'send_at_command') as mock_send:
-            mock_send.side_effect = [
+
+        with patch.object(self.reader, 'send_at_pipeline') as mock_send:
+            mock_send.return_value = [
                 {'success': True, 'data': ''},  # CMGF=1
                 {'success': True, 'data': mock_sms_data}  # CMGL="ALL"
             ]
-            
+
             messages = self.reader.list_all_sms()
-            
+
             assert len(messages) == 2
             assert messages[0]['index'] == '0'
             assert messages[0]['status'] == 'REC UNREAD'
@@ -63,26 +63,29 @@ Test message'''
             assert messages[0]['content'] == 'Hello World'
             assert messages[1]['index'] == '1'
             assert messages[1]['status'] == 'REC READ'
-    
+
     def test_list_all_sms_cmgf_fails(self):
         """Test listing SMS when CMGF fails."""
-        with patch.object(self.reader, 'send_at_command') as mock_send:
-            mock_send.return_value = {'success': False, 'data': ''}
-            
+        with patch.object(self.reader, 'send_at_pipeline') as mock_send:
+            mock_send.return_value = [
+                {'success': False, 'data': ''},  # CMGF=1 - fails
+                {'success': False, 'data': ''}   # CMGL="ALL" - unanswered
+            ]
+
             messages = self.reader.list_all_sms()
-            
+
             assert messages is None
-    
+
     def test_list_all_sms_cmgl_fails(self):
         """Test listing SMS when CMGL fails."""
-        with patch.object(self.reader, 'send_at_command') as mock_send:
-            mock_send.side_effect = [
+        with patch.object(self.reader, 'send_at_pipeline') as mock_send:
+            mock_send.return_value = [
                 {'success': True, 'data': ''},  # CMGF=1
                 {'success': False, 'data': ''}  # CMGL="ALL" - fails
             ]
-            
+
             messages = self.reader.list_all_sms()
-            
+
             assert messages is None
     
     def test_parse_sms_messages_single(self):
@@ -8,11 +8,11 @@ import serial
 import time
 import os
 from unittest.mock import Mock, patch, mock_open
-from io import BytesIO
 
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from src.send_sms import SMSSender
+from tests._serial_mock import make_serial_mock
 
 
 class TestSMSSender:
@@ -30,53 +30,32 @@ class TestSMSSender:
     
     def test_send_sms_message_success(self):
         """Test successfully sending an SMS message."""
-        mock_ser = Mock()
-        mock_ser.is_open = True
-        mock_ser.reset_input_buffer = Mock()
-        
         # Simulate the flow:
         # 1. CMGF=1 response
         # 2. CMGS command
         # 3. Prompt response "> "
         # 4. After sending Ctrl+Z, OK response
-        call_count = 0
-        
-        def in_waiting_side_effect():
-            nonlocal call_count
-            call_count += 1
-            # Return True for initial check, then False when done
-            return call_count <= 10
-        
-        mock_ser.in_waiting = Mock(side_effect=in_waiting_side_effect)
-        
-        readline_responses = [
-            b'\r\n',  # Empty line
-            b'> \r\n',  # Prompt
+        mock_ser = make_serial_mock([
+            b'\r\n> ',  # Prompt
             b'\r\n',  # Empty after sending
             b'+CMGS: 1\r\n',  # Success response
             b'OK\r\n'  # Final OK
-        ]
-        readline_iterator = iter(readline_responses)
-        
-        def readline_side_effect():
-            try:
-                return next(readline_iterator)
-            except StopIteration:
-                return b'\r\n'
-        
-        mock_ser.readline.side_effect = readline_side_effect
-        
+        ])
+
         self.sender.ser = mock_ser
-        
+
         with patch.object(self.sender, 'send_at_command') as mock_send:
             mock_send.return_value = {'success': True, 'data': ''}
-            
+
             result = self.sender.send_sms_message('+1234567890', 'Test message')
-            
+
             assert result['success'] is True
             mock_send.assert_called_once_with('AT+CMGF=1')
-            # Verify that write was called for the message and Ctrl+Z
-            assert mock_ser.write.call_count >= 2
+            # One write for the CMGS command, then exactly one carrying the
+            # message body and Ctrl+Z terminator together
+            assert mock_ser.write.call_count == 2
+            payload = mock_ser.write.call_args_list[-1][0][0]
+            assert payload == 'Test message'.encode() + b'\x1A'
     
     def test_send_sms_message_cmgf_fails(self):
         """Test sending SMS when CMGF fails."""
@@ -94,12 +73,8 @@ class TestSMSSender:
     
     def test_send_sms_message_no_prompt(self):
         """Test sending SMS when prompt is not received."""
-        mock_ser = Mock()
-        mock_ser.is_open = True
-        mock_ser.reset_input_buffer = Mock()
-        mock_ser.in_waiting = Mock(return_value=False)
-        mock_ser.readline.return_value = b'\r\n'
-        
+        mock_ser = make_serial_mock()  # every read times out, no prompt
+
         self.sender.ser = mock_ser
         
         with patch.object(self.sender, 'send_at_command') as mock_send:
@@ -112,16 +87,12 @@ class TestSMSSender:
     
     def test_send_sms_message_send_fails(self):
         """Test sending SMS when send fails."""
-        mock_ser = Mock()
-        mock_ser.is_open = True
-        mock_ser.reset_input_buffer = Mock()
-        mock_ser.in_waiting = Mock(return_value=True)
-        mock_ser.readline.side_effect = [
-            b'> \r\n',  # Prompt received
+        mock_ser = make_serial_mock([
+            b'\r\n> ',  # Prompt received
             b'\r\n',
             b'ERROR\r\n'  # Error response
-        ]
-        
+        ])
+
         self.sender.ser = mock_ser
         
         with patch.object(self.sender, 'send_at_command') as mock_send:
@@ -195,35 +166,13 @@ class TestSMSSender:
     
     def test_send_sms_message_with_unicode(self):
         """Test sending SMS with Unicode characters."""
-        mock_ser = Mock()
-        mock_ser.is_open = True
-        mock_ser.reset_input_buffer = Mock()
-        
-        call_count = 0
-        def in_waiting_side_effect():
-            nonlocal call_count
-            call_count += 1
-            return call_count <= 8
-        
-        mock_ser.in_waiting = Mock(side_effect=in_waiting_side_effect)
-        
-        readline_responses = [
-            b'\r\n',
-            b'> \r\n',  # Prompt
+        mock_ser = make_serial_mock([
+            b'\r\n> ',  # Prompt
             b'\r\n',
             b'+CMGS: 1\r\n',
             b'OK\r\n'
-        ]
-        readline_iterator = iter(readline_responses)
-        
-        def readline_side_effect():
-            try:
-                return next(readline_iterator)
-            except StopIteration:
-                return b'\r\n'
-        
-        mock_ser.readline.side_effect = readline_side_effect
-        
+        ])
+
         self.sender.ser = mock_ser
         
         with patch.object(self.sender, 'send_at_command') as mock_send:
@@ -7,7 +7,6 @@ import pytest
 import serial
 import time
 from unittest.mock import Mock, patch
-from io import BytesIO
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -72,29 +71,15 @@ class TestSIM800C:
         """Test sending AT command with success response."""
         mock_ser = Mock()
         mock_ser.is_open = True
-        in_waiting_count = 0
-        
-        def in_waiting_side_effect():
-            nonlocal in_waiting_count
-            in_waiting_count += 1
-            return in_waiting_count <= 4
-        
-        mock_ser.in_waiting = Mock(side_effect=in_waiting_side_effect)
+        mock_ser.in_waiting = 0
         mock_ser.reset_input_buffer = Mock()
-        
+
         responses = iter([
-            BytesIO(b'AT\r\n').readline(),
-            BytesIO(b'SIM800 R14.18\r\n').readline(),
-            BytesIO(b'OK\r\n').readline(),
+            b'AT\r\n',
+            b'SIM800 R14.18\r\n',
+            b'OK\r\n',
         ])
-        
-        def readline_side_effect():
-            try:
-                return next(responses)
-            except StopIteration:
-                return b'\r\n'
-        
-        mock_ser.readline.side_effect = readline_side_effect
+        mock_ser.read.side_effect = lambda size=1: next(responses, b'')
         mock_serial.return_value = mock_ser
         self.sim800.ser = mock_ser
         
@@ -111,6 +96,35 @@ class TestSIM800C:
         assert result['success'] is False
         assert result['data'] == ''
     
+    def test_send_at_batch(self):
+        """Test batching multiple AT commands into one line."""
+        with patch.object(self.sim800, 'send_at_command') as mock_send:
+            mock_send.return_value = {
+                'success': True,
+                'data': '+CFUN: 1\n+CMGF: 1'
+            }
+
+            result = self.sim800.send_at_batch(['AT+CFUN?', 'AT+CMGF?'])
+
+            assert result['success'] is True
+            mock_send.assert_called_once_with('AT+CFUN?;+CMGF?', timeout=5)
+
+    @patch('serial.Serial')
+    def test_send_at_pipeline(self, mock_serial):
+        """Test pipelining commands and splitting their responses."""
+        mock_ser = Mock()
+        mock_ser.is_open = True
+        mock_ser.in_waiting = 0
+        responses = iter([b'+CFUN: 1\r\nOK\r\n', b'+CMGF: 1\r\nOK\r\n'])
+        mock_ser.read.side_effect = lambda size=1: next(responses, b'')
+        self.sim800.ser = mock_ser
+
+        results = self.sim800.send_at_pipeline(['AT+CFUN?', 'AT+CMGF?'])
+
+        assert len(results) == 2
+        assert results[0] == {'success': True, 'data': '+CFUN: 1'}
+        assert results[1] == {'success': True, 'data': '+CMGF: 1'}
+
     def test_parse_response_value(self):
         """Test parsing response value."""
         # Test successful parse